@@ -2,154 +2,301 @@
 """
 Combine all markdown files in the repository into a single PDF.
 """
+import argparse
+import hashlib
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import markdown
-from weasyprint import HTML, CSS
-from io import StringIO
+
+# markdown and weasyprint are imported where they are used: WeasyPrint pulls
+# in cairo/pango bindings and fonttools, which --help and the "PDF
+# unchanged" path never need.
 
 # Directories to exclude from search
 EXCLUDE_DIRS = {'.venv', '.pytest_cache', 'node_modules', '.git', '__pycache__', 'dist', 'build'}
 
+# Markdown extensions used to render each file. codehilite is deliberately
+# absent: the stylesheet has no Pygments token rules, so highlighting cost
+# CPU without changing the output. fenced_code still renders <pre><code>.
+MARKDOWN_EXTENSIONS = [
+    'extra',
+    'toc',
+    'tables',
+    'fenced_code'
+]
+
+# Rendered HTML fragments are cached here, keyed by content hash
+CACHE_DIR_NAME = '.md_html_cache'
+
+# Generated artifacts (written to the project root, never read back as input)
+COMBINED_MD_NAME = 'combined_documentation.md'
+OUTPUT_PDF_NAME = 'sprig_config_documentation.pdf'
+DIGEST_SUFFIX = '.hash'
+
+# Set to 1/true/yes to write COMBINED_MD_NAME without --save-combined-md
+SAVE_MD_ENV = 'SPRIG_SAVE_MD'
+
+def get_project_root():
+    """Return the project root (parent of sprig-config-module when run from it)."""
+    cwd = Path.cwd()
+    return cwd.parent if 'sprig-config-module' in str(cwd) else cwd
+
 def find_markdown_files(root_dir):
     """Find all markdown files, excluding specified directories."""
     md_files = []
-    root_path = Path(root_dir)
 
-    for md_file in root_path.rglob('*.md'):
-        # Check if any parent directory is in exclude list
-        if any(excluded in md_file.parts for excluded in EXCLUDE_DIRS):
-            continue
-        md_files.append(md_file)
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        # Prune excluded directories in place so the walk never enters them
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        md_files.extend(
+            os.path.join(dirpath, f) for f in filenames
+            if f.endswith('.md') and f != COMBINED_MD_NAME
+        )
 
-    # Sort files for consistent ordering
-    md_files.sort()
+    # Sort files for consistent ordering (component-wise, like Path ordering)
+    md_files.sort(key=lambda p: p.split(os.sep))
     return md_files
 
-def combine_markdown_files(md_files):
-    """Combine all markdown files into a single markdown string."""
-    combined = StringIO()
+def combine_markdown_files(md_files, base_dir=None):
+    """
+    Combine all markdown files into a single markdown string.
+
+    File headers show paths relative to base_dir (default: the project root).
+
+    Returns a tuple of (combined_markdown, sections), where sections is a
+    list of (path, markdown_bytes) pairs, one per file, used for per-file
+    HTML rendering and caching.
+    """
+    parts = []
+    sections = []
+    base = base_dir if base_dir is not None else get_project_root()
 
     for i, md_file in enumerate(md_files):
         if i > 0:
-            combined.write('\n\n---\n\n')  # Page break separator
+            parts.append('\n\n---\n\n')  # Page break separator
 
         # Add file header
-        relative_path = md_file.relative_to(Path.cwd().parent if 'sprig-config-module' in str(Path.cwd()) else Path.cwd())
-        combined.write(f'# File: {relative_path}\n\n')
+        relative_path = os.path.relpath(md_file, base)
+        header = f'# File: {relative_path}\n\n'
 
         # Read and add file content
         try:
-            content = md_file.read_text(encoding='utf-8')
-            combined.write(content)
-            combined.write('\n')
+            with open(md_file, 'rb') as f:
+                content = f.read().decode('utf-8') + '\n'
         except Exception as e:
-            combined.write(f'*Error reading file: {e}*\n')
-
-    return combined.getvalue()
-
-def convert_to_pdf(markdown_content, output_pdf):
-    """Convert markdown content to PDF."""
-    # Convert markdown to HTML
-    md = markdown.Markdown(extensions=[
-        'extra',
-        'codehilite',
-        'toc',
-        'tables',
-        'fenced_code'
-    ])
-    html_content = md.convert(markdown_content)
-
-    # Create full HTML document with styling
+            content = f'*Error reading file: {e}*\n'
+
+        parts.append(header)
+        parts.append(content)
+        sections.append((md_file, (header + content).encode('utf-8')))
+
+    return ''.join(parts), sections
+
+def _section_cache_key(content):
+    """Hash a section's markdown bytes together with the extension set."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr(MARKDOWN_EXTENSIONS).encode('utf-8'))
+    hasher.update(content)
+    return hasher.hexdigest()
+
+# Per-process Markdown converter, built once by _init_worker()
+_MD = None
+
+def _init_worker():
+    """Build the worker's Markdown converter once per process."""
+    global _MD
+    import markdown
+
+    _MD = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+
+def _render_one(content):
+    """Render one section's markdown bytes to HTML (process pool worker)."""
+    if _MD is None:
+        _init_worker()
+    html_fragment = _MD.convert(content.decode('utf-8'))
+    _MD.reset()
+    return html_fragment
+
+def render_sections(sections, cache_dir):
+    """
+    Render each section to an HTML fragment.
+
+    Fragments are looked up in cache_dir by content hash; only sections whose
+    bytes changed since the last run are passed through markdown again. Cache
+    misses are rendered in parallel worker processes, and the fragments are
+    returned in the original section order.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    fragments = [None] * len(sections)
+    misses = []
+
+    for i, (_path, content) in enumerate(sections):
+        cached = cache_dir / f'{_section_cache_key(content)}.html'
+        if cached.exists():
+            fragments[i] = cached.read_text(encoding='utf-8')
+        else:
+            misses.append((i, cached, content))
+
+    if misses:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=_init_worker
+        ) as executor:
+            rendered = executor.map(
+                _render_one,
+                [content for _i, _cached, content in misses],
+                chunksize=8,
+            )
+            for (i, cached, _content), html_fragment in zip(misses, rendered):
+                cached.write_text(html_fragment, encoding='utf-8')
+                fragments[i] = html_fragment
+
+    return fragments
+
+# Stylesheet fragments. Each entry pairs the CSS with a marker that must
+# appear in the rendered HTML for its selectors to match anything; a marker
+# of None means the rules are always included.
+CSS_FRAGMENTS = [
+    (None, """
+        @page {
+            size: letter;
+            margin: 1in;
+            @bottom-right {
+                content: counter(page);
+            }
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 100%;
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 2px solid #3498db;
+            padding-bottom: 10px;
+            margin-top: 30px;
+            page-break-before: auto;
+        }
+        h2 {
+            color: #34495e;
+            border-bottom: 1px solid #bdc3c7;
+            padding-bottom: 8px;
+            margin-top: 25px;
+        }
+        h3 {
+            color: #7f8c8d;
+            margin-top: 20px;
+        }
+        hr {
+            border: none;
+            border-top: 3px double #bdc3c7;
+            margin: 40px 0;
+            page-break-after: always;
+        }"""),
+    ('<code', """
+        code {
+            background-color: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: "Monaco", "Menlo", "Courier New", monospace;
+            font-size: 0.9em;
+        }"""),
+    ('<pre', """
+        pre {
+            background-color: #f6f8fa;
+            padding: 16px;
+            border-radius: 6px;
+            overflow-x: auto;
+            border: 1px solid #e1e4e8;
+        }
+        pre code {
+            background-color: transparent;
+            padding: 0;
+        }"""),
+    ('<table', """
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #f6f8fa;
+            font-weight: bold;
+        }"""),
+    ('<blockquote', """
+        blockquote {
+            border-left: 4px solid #3498db;
+            padding-left: 20px;
+            margin-left: 0;
+            color: #7f8c8d;
+        }"""),
+    ('<a ', """
+        a {
+            color: #3498db;
+            text-decoration: none;
+        }"""),
+    ('<li', """
+        ul, ol {
+            margin-left: 20px;
+        }"""),
+]
+
+# Parsed CSS objects, compiled once per process and reused across renders
+_CSS_CACHE = {}
+
+def build_stylesheets(html_content):
+    """
+    Return compiled stylesheets for the CSS rules that can match html_content.
+
+    Each fragment is parsed into a weasyprint.CSS object the first time it
+    is needed; later renders in the same process reuse the parsed rules.
+    """
+    from weasyprint import CSS
+
+    stylesheets = []
+    for marker, css in CSS_FRAGMENTS:
+        if marker is not None and marker not in html_content:
+            continue
+        if css not in _CSS_CACHE:
+            _CSS_CACHE[css] = CSS(string=css)
+        stylesheets.append(_CSS_CACHE[css])
+    return stylesheets
+
+def document_digest(combined_md):
+    """Hash everything that affects the rendered PDF."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(repr(MARKDOWN_EXTENSIONS).encode('utf-8'))
+    for _marker, css in CSS_FRAGMENTS:
+        hasher.update(css.encode('utf-8'))
+    hasher.update(combined_md.encode('utf-8'))
+    return hasher.hexdigest()
+
+def convert_to_pdf(sections, output_pdf, cache_dir):
+    """
+    Convert per-file markdown sections to PDF.
+
+    The sections are laid out as one document in a single WeasyPrint pass,
+    so footer page numbers run continuously through the whole manual.
+    """
+    from weasyprint import HTML
+
+    # Convert markdown to HTML, one cached fragment per file
+    html_content = '\n<hr />\n'.join(render_sections(sections, cache_dir))
+
+    # Create full HTML document; styling is passed as precompiled stylesheets
     full_html = f"""
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <title>SprigConfig Documentation</title>
-        <style>
-            @page {{
-                size: letter;
-                margin: 1in;
-                @bottom-right {{
-                    content: counter(page);
-                }}
-            }}
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 100%;
-            }}
-            h1 {{
-                color: #2c3e50;
-                border-bottom: 2px solid #3498db;
-                padding-bottom: 10px;
-                margin-top: 30px;
-                page-break-before: auto;
-            }}
-            h2 {{
-                color: #34495e;
-                border-bottom: 1px solid #bdc3c7;
-                padding-bottom: 8px;
-                margin-top: 25px;
-            }}
-            h3 {{
-                color: #7f8c8d;
-                margin-top: 20px;
-            }}
-            code {{
-                background-color: #f4f4f4;
-                padding: 2px 6px;
-                border-radius: 3px;
-                font-family: "Monaco", "Menlo", "Courier New", monospace;
-                font-size: 0.9em;
-            }}
-            pre {{
-                background-color: #f6f8fa;
-                padding: 16px;
-                border-radius: 6px;
-                overflow-x: auto;
-                border: 1px solid #e1e4e8;
-            }}
-            pre code {{
-                background-color: transparent;
-                padding: 0;
-            }}
-            table {{
-                border-collapse: collapse;
-                width: 100%;
-                margin: 20px 0;
-            }}
-            th, td {{
-                border: 1px solid #ddd;
-                padding: 12px;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f6f8fa;
-                font-weight: bold;
-            }}
-            hr {{
-                border: none;
-                border-top: 3px double #bdc3c7;
-                margin: 40px 0;
-                page-break-after: always;
-            }}
-            blockquote {{
-                border-left: 4px solid #3498db;
-                padding-left: 20px;
-                margin-left: 0;
-                color: #7f8c8d;
-            }}
-            a {{
-                color: #3498db;
-                text-decoration: none;
-            }}
-            ul, ol {{
-                margin-left: 20px;
-            }}
-        </style>
     </head>
     <body>
         {html_content}
@@ -158,32 +305,68 @@ def convert_to_pdf(markdown_content, output_pdf):
     """
 
     # Convert HTML to PDF
-    HTML(string=full_html).write_pdf(output_pdf)
+    document = HTML(string=full_html).render(
+        stylesheets=build_stylesheets(html_content)
+    )
 
-def main():
+    # Render to an in-memory buffer and write the file in one call
+    pdf_bytes = document.write_pdf()
+    Path(output_pdf).write_bytes(pdf_bytes)
+    return len(pdf_bytes)
+
+def parse_args(argv=None):
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--save-combined-md',
+        action='store_true',
+        default=os.getenv(SAVE_MD_ENV, '').strip().lower() in ('1', 'true', 'yes'),
+        help=f'Also write {COMBINED_MD_NAME} to the project root '
+             f'(default: off, or on when {SAVE_MD_ENV} is 1, true or yes)',
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function."""
+    args = parse_args(argv)
+
     print("Finding markdown files...")
 
     # Start from project root (parent of sprig-config-module)
-    project_root = Path.cwd().parent if 'sprig-config-module' in str(Path.cwd()) else Path.cwd()
+    project_root = get_project_root()
     md_files = find_markdown_files(project_root)
 
     print(f"Found {len(md_files)} markdown files")
 
     print("Combining markdown files...")
-    combined_md = combine_markdown_files(md_files)
+    combined_md, sections = combine_markdown_files(md_files, project_root)
+
+    # Save combined markdown for reference (opt-in)
+    if args.save_combined_md:
+        combined_md_path = project_root / COMBINED_MD_NAME
+        combined_md_path.write_text(combined_md, encoding='utf-8')
+        print(f"Saved combined markdown to: {combined_md_path}")
+
+    # Skip the PDF render entirely if nothing that feeds it has changed
+    output_pdf = project_root / OUTPUT_PDF_NAME
+    digest_path = output_pdf.with_name(output_pdf.name + DIGEST_SUFFIX)
+    digest = document_digest(combined_md)
 
-    # Save combined markdown for reference
-    combined_md_path = project_root / 'combined_documentation.md'
-    combined_md_path.write_text(combined_md, encoding='utf-8')
-    print(f"Saved combined markdown to: {combined_md_path}")
+    if (
+        output_pdf.exists()
+        and digest_path.exists()
+        and digest_path.read_text(encoding='utf-8').strip() == digest
+    ):
+        print(f"✓ PDF unchanged: {output_pdf}")
+        return
 
     print("Converting to PDF...")
-    output_pdf = project_root / 'sprig_config_documentation.pdf'
-    convert_to_pdf(combined_md, str(output_pdf))
+    pdf_size = convert_to_pdf(sections, str(output_pdf), project_root / CACHE_DIR_NAME)
+    digest_path.write_text(digest + '\n', encoding='utf-8')
 
     print(f"✓ PDF created: {output_pdf}")
     print(f"  - Total files included: {len(md_files)}")
+    print(f"  - Size: {pdf_size / 1024:.1f} KiB")
 
 if __name__ == '__main__':
     main()
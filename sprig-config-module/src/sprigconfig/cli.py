@@ -7,16 +7,17 @@
 
 from sprigconfig.config_loader import ConfigLoader
 from sprigconfig.exceptions import ConfigLoadError
-from sprigconfig.lazy_secret import LazySecret
 from sprigconfig.help import COMMAND_HELP
+from sprigconfig.parsers.yaml_parser import SafeDumper
 
 
 def _render_pretty_yaml(data):
     """Render clean, reusable, human-friendly YAML."""
     import yaml
 
-    return yaml.safe_dump(
+    return yaml.dump(
         data,
+        Dumper=SafeDumper,
         sort_keys=False,
         default_flow_style=False,
         allow_unicode=True,
@@ -24,24 +25,20 @@ def _render_pretty_yaml(data):
     )
 
 
+def _render_json(data):
+    """Render pretty JSON."""
+    return json.dumps(data, indent=2)
+
+
 def _extract_data_for_dump(config, reveal_secrets: bool):
     """
     Convert Config → plain dict ready for YAML/JSON output.
     Uses Config.to_dict() to avoid !!python/object wrappers.
-    """
-
-    raw = config.to_dict(reveal_secrets=reveal_secrets)
 
-    def walk(node):
-        if isinstance(node, LazySecret):
-            return node.get() if reveal_secrets else "ENC(**REDACTED**)"
-        if isinstance(node, dict):
-            return {k: walk(v) for k, v in node.items()}
-        if isinstance(node, list):
-            return [walk(v) for v in node]
-        return node
-
-    return walk(raw)
+    to_dict() already replaces every LazySecret (with its plaintext or
+    "<LazySecret>"), so the result is not walked a second time here.
+    """
+    return config.to_dict(reveal_secrets=reveal_secrets)
 
 
 def run_dump(
@@ -63,7 +60,7 @@ def run_dump(
     output = _extract_data_for_dump(config, reveal_secrets=reveal_secrets)
 
     if output_fmt == "json":
-        rendered = json.dumps(output, indent=2)
+        rendered = _render_json(output)
     else:
         rendered = _render_pretty_yaml(output)
 
@@ -74,7 +71,11 @@ def run_dump(
         print(rendered)
 
 
-def main():
+def main(argv=None):
+    """Run the CLI; ``argv`` defaults to ``sys.argv[1:]``."""
+    if argv is None:
+        argv = sys.argv[1:]
+
     parser = argparse.ArgumentParser(
         prog="sprigconfig",
         description="SprigConfig command-line utilities",
@@ -138,21 +139,21 @@ def main():
     # ------------------------------------------------------------------
     # Early help handling
     # ------------------------------------------------------------------
-    if len(sys.argv) == 1:
+    if not argv:
         parser.print_help()
         print("\nAvailable commands:")
         for name, meta in COMMAND_HELP.items():
             print(f"  {name:<8} {meta['summary']}")
         sys.exit(0)
 
-    if len(sys.argv) == 2 and sys.argv[1] == "dump":
+    if argv == ["dump"]:
         dump.print_help()
         print("\nExamples:")
         for ex in COMMAND_HELP["dump"]["examples"]:
             print(f"  {ex}")
         sys.exit(0)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.command == "dump":
         run_dump(
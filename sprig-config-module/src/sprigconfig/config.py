@@ -11,11 +11,19 @@
 """
 
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
 from .lazy_secret import LazySecret
 from .exceptions import ConfigLoadError
+from .parsers.yaml_parser import SafeDumper
+
+
+@lru_cache(maxsize=4096)
+def _split_key(key):
+    """Split a dotted key into its parts; hot keys are split only once."""
+    return tuple(key.split("."))
 
 
 class Config(Mapping):
@@ -64,10 +72,9 @@ def __getitem__(self, key):
         Strict: raises KeyError if any part is missing.
         """
         if isinstance(key, str) and "." in key:
-            parts = key.split(".")
             node = self._data
 
-            for part in parts:
+            for part in _split_key(key):
                 if not isinstance(node, dict) or part not in node:
                     raise KeyError(key)
                 node = node[part]
@@ -109,10 +116,9 @@ def get(self, key, default=None):
         if "." not in key:
             return self._resolve_leaf(key, default)
 
-        parts = key.split(".")
         node = self._data
 
-        for part in parts:
+        for part in _split_key(key):
             if isinstance(node, dict):
                 if part not in node:
                     return default
@@ -147,6 +153,15 @@ def to_dict(self, *, reveal_secrets=False):
         """
         return self._to_plain(self._data, reveal_secrets=reveal_secrets)
 
+    def _to_dict_view(self):
+        """
+        Return the underlying dict without copying.
+
+        For trusted serializers that walk the tree themselves; LazySecret
+        values are left in place and the result must not be mutated.
+        """
+        return self._data
+
     def _to_plain(self, obj, *, reveal_secrets=False):
         if isinstance(obj, LazySecret):
             if reveal_secrets:
@@ -205,8 +220,9 @@ def dump(
                     reordered[key] = value
             data = reordered
 
-        yaml_dump = yaml.safe_dump(
+        yaml_dump = yaml.dump(
             data,
+            Dumper=SafeDumper,
             sort_keys=False,
             default_flow_style=not pretty,
             indent=2,
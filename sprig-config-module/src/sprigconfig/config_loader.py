@@ -15,10 +15,15 @@
       sprigconfig._meta.import_trace
 """
 
+import codecs
+import copy
+import hashlib
 import os
 import re
+import sys
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import AnyStr, Dict, Any, List, NamedTuple, Optional
 
 from .config import Config
 from .lazy_secret import LazySecret
@@ -31,8 +36,14 @@
 # CONSTANTS
 # ======================================================================
 
+# Reference grammar for ${VAR} / ${VAR:default}. _expand_env implements the
+# same grammar with a hand-written scanner instead of a regex callback.
 ENV_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
 
+# Marks "not memoized yet" in the per-load environment cache, where None
+# is a real (unset variable) value.
+_UNSET = object()
+
 SUPPORTED_FORMATS = {"yaml", "json", "toml"}
 
 FORMAT_ALIASES = {
@@ -45,12 +56,98 @@
     "toml": ("toml",),
 }
 
+# Formats that are parsed first and expanded on string values afterwards,
+# so an environment value containing quotes or backslashes cannot break
+# the syntax. A file that only parses once expanded (an unquoted
+# `port = ${PORT}`) falls back to text-level expansion, as before. YAML
+# always expands as text, which lets an unquoted ${PORT} resolve to a
+# typed scalar.
+EXPAND_AFTER_PARSE = {"json", "toml"}
+
+# Formats whose parsers accept UTF-8 bytes directly. Files in these formats
+# that need no text-level expansion are never decoded into a str here.
+BYTES_PARSE_FORMATS = {"yaml", "json"}
+
 PARSERS = {
     "yaml": YamlParser(),
     "json": JsonParser(),
     "toml": TomlParser(),
 }
 
+# Marker for encrypted values: a string is a secret when it starts with
+# _ENC_PREFIX and ends with ")". Checked with a slice compare rather than
+# startswith/endswith, which avoids two method calls per string leaf; a
+# one-character slice (a cached str) is compared first, so most
+# non-secret strings are rejected without building a 4-character slice.
+_ENC_PREFIX = "ENC("
+_ENC_PREFIX_BYTES = b"ENC("
+
+# Exact-type dispatch for the secret and expansion walks. Parsers only
+# produce builtin types, so one dict lookup on type(value) replaces a
+# chain of isinstance() calls per value; anything else (subclasses, YAML
+# timestamps) is classified by _walk_kind.
+_SKIP, _STRING, _CONTAINER = 0, 1, 2
+_WALK_KINDS = {
+    str: _STRING,
+    dict: _CONTAINER,
+    list: _CONTAINER,
+    int: _SKIP,
+    float: _SKIP,
+    bool: _SKIP,
+    type(None): _SKIP,
+}
+
+
+def _walk_kind(value: Any) -> int:
+    """Classify a value whose exact type is not in _WALK_KINDS."""
+    if isinstance(value, str):
+        return _STRING
+    if isinstance(value, (dict, list)):
+        return _CONTAINER
+    return _SKIP
+
+# os.path.normcase is the identity except on Windows; skip calling it
+# per directory entry where it cannot change anything.
+_CASE_SENSITIVE_PATHS = os.path.normcase("A") == "A"
+
+class _CachedFile(NamedTuple):
+    stamp: tuple        # (st_mtime_ns, st_size, format)
+    digest: tuple       # (format, blake2b of the exact text that was parsed)
+    data: Any
+    expand_values: bool  # ${...} left in string values to expand per load
+    has_enc: bool
+    text_expanded: bool  # ${...} was substituted before parsing
+
+
+# Parsed file contents shared by all loaders in the process, keyed by
+# resolved path so a rewritten file replaces its stale entry.
+#
+# A matching stamp is enough to reuse an entry without reading the file.
+# Otherwise the file is read and hashed, and a matching digest still
+# skips the parse (e.g. after a touch or checkout). Files whose ${...}
+# references were expanded as text before parsing (YAML, and JSON/TOML
+# that need it) have a digest covering the expanded text, and the stamp
+# alone is never trusted for them.
+_FILE_CACHE: Dict[str, _CachedFile] = {}
+
+# Upper bound on _FILE_CACHE entries; the oldest entry is evicted first.
+FILE_CACHE_MAX_ENTRIES = 256
+
+# Serializes every write to _FILE_CACHE (insertion, eviction, stamp
+# refresh, clear) when loaders run on several threads; iterating the dict
+# to find the oldest entry must not race an insert.
+_FILE_CACHE_LOCK = threading.Lock()
+
+# Set to 1/true/yes to read and parse every file on every load, bypassing
+# _FILE_CACHE entirely (e.g. when debugging a suspected stale parse).
+DISABLE_CACHE_ENV = "SPRIGCONFIG_DISABLE_CACHE"
+
+
+def clear_file_cache() -> None:
+    """Drop every parsed file held by the process-wide file cache."""
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.clear()
+
 # ======================================================================
 # CONFIG LOADER
 # ======================================================================
@@ -98,6 +195,10 @@ def __init__(
             config_dir = Path(env_dir)
 
         self.config_dir = Path(config_dir)
+        # Internally paths are plain strings handled with os.path: every
+        # pathlib operation builds a new Path object in Python code.
+        self._config_dir_str = str(self.config_dir)
+        self._config_dir_resolved = os.path.realpath(self._config_dir_str)
         self.profile = profile
 
         raw_format = (
@@ -110,24 +211,63 @@ def __init__(
         self.parser = PARSERS[self.format]
         self.schema = schema
 
+        # Root file candidates depend only on directory, profile and format
+        self._base_candidates = self._root_candidates("application")
+        self._profile_candidates = self._root_candidates(f"application-{self.profile}")
+
         # Import + merge tracking
         self._merge_trace: List[str] = []
         self._import_trace: List[dict] = []
-        self._seen_imports: set[str] = set()
-        self._order = 0
+        # Files currently being processed along the active import chain
+        self._import_stack: set[str] = set()
+
+        # import_key -> interned resolved path, reset on every load();
+        # realpath() stats every path component
+        self._resolve_cache: Dict[str, str] = {}
+
+        # Environment lookups made by _expand_env, reset on every load()
+        self._env_cache: Dict[str, Optional[str]] = {}
+        self._has_enc = False
+
+        # directory -> names it contains, listed once per load() by _exists
+        self._dir_names: Dict[str, frozenset] = {}
+        # Re-read from DISABLE_CACHE_ENV on every load()
+        self._use_file_cache = True
 
     # ==================================================================
     # PUBLIC API
     # ==================================================================
 
     def load(self) -> Config:
+        # Per-load state: a reused loader sees the files and environment as
+        # they are now, and the traces handed to a previous Config's _meta
+        # are new lists rather than appended to.
+        self._merge_trace = []
+        self._import_trace = []
+        self._import_stack = set()
+        self._resolve_cache = {}
+        # Each load sees the environment as it is now, read once per variable
+        self._env_cache = {}
+        self._dir_names = {}
+        self._use_file_cache = (
+            os.getenv(DISABLE_CACHE_ENV, "").strip().lower() not in ("1", "true", "yes")
+        )
+        # Set by _load_file when any loaded content contains "ENC("
+        self._has_enc = False
+
+        # Without a schema, ENC(...) values are wrapped during the import
+        # walk, which already visits every value of every file; this saves
+        # a separate pass over the merged tree. Schema validation must see
+        # the raw strings, so with a schema wrapping happens after it.
+        wrap_secrets = self.schema is None
+        secret_key = os.getenv("APP_SECRET_KEY")
+
         # --------------------------------------------------
         # 1. Load base config
         # --------------------------------------------------
-        base_file = self._resolve_root_file("application")
-        base_data = self._load_file(base_file)
+        base_file, root_path = self._resolve_root_file(self._base_candidates)
+        base_data = self._load_file(base_file, root_path)
 
-        root_path = str(base_file.resolve())
         self._record_import(
             file=root_path,
             imported_by=None,
@@ -142,22 +282,23 @@ def load(self) -> Config:
             parent_file=root_path,
             depth=0,
             suppress=suppress,
+            wrap_secrets=wrap_secrets,
+            secret_key=secret_key,
         )
 
         # --------------------------------------------------
         # 2. Load profile overlay
         # --------------------------------------------------
         profile_data = {}
-        profile_file = self._resolve_root_file(f"application-{self.profile}")
+        profile_file, profile_path = self._resolve_root_file(self._profile_candidates)
 
-        if profile_file.exists():
-            profile_data = self._load_file(profile_file)
+        if self._exists(profile_file):
+            profile_data = self._load_file(profile_file, profile_path)
 
-            profile_path = str(profile_file.resolve())
             self._record_import(
                 file=profile_path,
                 imported_by=root_path,
-                import_key=profile_file.name,
+                import_key=os.path.basename(profile_file),
                 depth=1,
             )
 
@@ -170,6 +311,8 @@ def load(self) -> Config:
                 parent_file=profile_path,
                 depth=1,
                 suppress=suppress,
+                wrap_secrets=wrap_secrets,
+                secret_key=secret_key,
             )
 
         # --------------------------------------------------
@@ -183,7 +326,12 @@ def load(self) -> Config:
         merged.setdefault("app", {})["profile"] = self.profile
 
         self._inject_metadata(merged)
-        self._inject_secrets(merged)
+
+        # Every value in the tree came from a loaded file (or from the
+        # loader's own metadata), so without an "ENC(" anywhere in the
+        # input there is nothing to wrap.
+        if self._has_enc and not wrap_secrets:
+            self._inject_secrets(merged, secret_key)
 
         return Config(merged)
 
@@ -191,56 +339,107 @@ def load(self) -> Config:
     # FILE RESOLUTION
     # ==================================================================
 
-    def _resolve_root_file(self, stem: str) -> Path:
+    def _root_candidates(self, stem: str) -> tuple:
         """
-        Resolve root config files using format-specific extension aliases.
+        Build (path, resolved path) string pairs for a root config file,
+        one per format-specific extension alias, canonical extension first.
         """
-        for ext in FORMAT_EXTENSIONS[self.format]:
-            candidate = self.config_dir / f"{stem}.{ext}"
-            if candidate.exists():
+        return tuple(
+            (path, sys.intern(os.path.realpath(path)))
+            for path in (
+                os.path.join(self._config_dir_str, f"{stem}.{ext}")
+                for ext in FORMAT_EXTENSIONS[self.format]
+            )
+        )
+
+    def _resolve_root_file(self, candidates: tuple) -> tuple:
+        """
+        Resolve a root config file from its precomputed candidates.
+
+        Returns the first (path, resolved) pair that exists on disk.
+        """
+        for candidate in candidates:
+            if self._exists(candidate[0]):
                 return candidate
 
         # Default canonical path (for error reporting)
-        return self.config_dir / f"{stem}.{self.format}"
+        return candidates[0]
 
-    def _resolve_import(self, import_key: str) -> Path:
+    def _exists(self, path: str) -> bool:
         """
-        Resolve import paths.
+        Check whether path exists using one directory listing per parent.
+
+        Root files and imports probe several extensions in the same few
+        directories, so listing each directory once per load() replaces
+        one stat per candidate with a set lookup. Names are compared after
+        os.path.normcase on Windows. A name missing from the listing is
+        still checked with os.path.exists(), since a case-insensitive POSIX
+        filesystem (macOS APFS by default) finds `Common.yml` as
+        `common.yml` while normcase leaves the name as written.
+        """
+        directory, name = os.path.split(path)
+        names = self._dir_names.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    if _CASE_SENSITIVE_PATHS:
+                        names = frozenset([e.name for e in entries])
+                    else:
+                        names = frozenset([os.path.normcase(e.name) for e in entries])
+            except OSError:
+                names = frozenset()
+            self._dir_names[directory] = names
+        if (name if _CASE_SENSITIVE_PATHS else os.path.normcase(name)) in names:
+            return True
+        return os.path.exists(path)
+
+    def _resolve_import(self, import_key: str) -> str:
+        """
+        Resolve import paths to an interned, fully resolved path string.
 
         Imports inherit format and never specify extensions.
         If the canonical extension does not exist on disk,
         try format-specific alias extensions (e.g. .yml for yaml).
+
+        Successful resolutions are cached for the rest of the current
+        load(), so a file imported from several branches is resolved once;
+        failures are not cached, so they are re-checked and re-raised.
         """
-        import_path = Path(import_key)
+        cached = self._resolve_cache.get(import_key)
+        if cached is not None:
+            return cached
 
-        candidates: list[Path] = []
+        config_dir = self._config_dir_str
+        candidates: list[str] = []
 
-        if "." in import_path.name:
+        if "." in os.path.basename(import_key):
             # Explicit extension provided (rare, but allow it)
-            candidates.append(self.config_dir / import_key)
+            candidates.append(os.path.join(config_dir, import_key))
         else:
             # No extension: try canonical first, then aliases
             for ext in FORMAT_EXTENSIONS[self.format]:
-                candidates.append(self.config_dir / f"{import_key}.{ext}")
+                candidates.append(os.path.join(config_dir, f"{import_key}.{ext}"))
 
-        base = self.config_dir.resolve()
+        base = os.path.normcase(self._config_dir_resolved)
+        base_prefix = base if base.endswith(os.sep) else base + os.sep
 
         for candidate in candidates:
-            resolved = candidate.resolve()
+            resolved = os.path.realpath(candidate)
 
-            # Path traversal protection
-            try:
-                resolved.relative_to(base)
-            except ValueError:
+            # Path traversal protection: the resolved file must be inside
+            # the resolved config directory (compared as normcased strings)
+            if not os.path.normcase(resolved).startswith(base_prefix):
                 raise ConfigLoadError(
                     f"Path traversal detected: import '{import_key}' escapes config directory"
                 )
 
-            if resolved.exists():
+            if self._exists(resolved):
+                resolved = sys.intern(resolved)
+                self._resolve_cache[import_key] = resolved
                 return resolved
 
         # If we get here, nothing matched
-        tried = ", ".join(str(p.name) for p in candidates)
+        tried = ", ".join(os.path.basename(p) for p in candidates)
         raise ConfigLoadError(
             f"Import '{import_key}' not found. Tried: {tried}"
         )
@@ -250,27 +449,224 @@ def _resolve_import(self, import_key: str) -> Path:
     # FILE LOADING
     # ==================================================================
 
-    def _load_file(self, path: Path) -> Dict[str, Any]:
-        if not path.exists():
+    def _load_file(
+        self,
+        path: str,
+        resolved: Optional[str] = None,
+        import_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load one file. A missing root file loads as {}; a missing import
+        (import_key given) raises ConfigLoadError.
+        """
+        if resolved is None:
+            resolved = sys.intern(os.path.realpath(path))
+
+        parsed = self._parse_file(path, resolved)
+        if parsed is None:
+            if import_key is not None:
+                # Resolved earlier in this load, gone by the time it is read
+                raise ConfigLoadError(f"Import '{import_key}' not found: {path}")
             return {}
 
-        resolved = str(path.resolve())
+        data, expand_values, has_enc = parsed
         self._merge_trace.append(resolved)
 
+        if has_enc:
+            self._has_enc = True
+        if expand_values:
+            self._expand_env_in_tree(data)
+        return data
+
+    def _parse_file(self, path: str, resolved: str) -> Optional[tuple]:
+        """
+        Read and parse one file through the shared parsed-file cache.
+
+        Returns (data, expand_values, has_enc), or None if the file does
+        not exist; expand_values is True when ${...} references still have
+        to be expanded in the parsed string values. Per-load bookkeeping
+        is left to _load_file.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        expand_after = self.format in EXPAND_AFTER_PARSE
+        use_cache = self._use_file_cache
+
+        # Callers merge into the returned dict, so hand out copies only.
+        stamp = (st.st_mtime_ns, st.st_size, self.format)
+        cached = _FILE_CACHE.get(resolved) if use_cache else None
+        if (
+            cached is not None
+            and cached.stamp == stamp
+            and not cached.text_expanded
+        ):
+            return copy.deepcopy(cached.data), cached.expand_values, cached.has_enc
+
+        try:
+            # Read once. The UTF-8 BOM (common in files saved on Windows)
+            # is skipped through a memoryview, so the bytes are not copied.
+            with open(path, "rb") as f:
+                raw = f.read()
+            source = memoryview(raw)
+            if raw.startswith(codecs.BOM_UTF8):
+                source = source[len(codecs.BOM_UTF8):]
+
+            has_refs = b"${" in raw
+            # A JSON/TOML file that needed text-level expansion last time
+            # goes straight there instead of failing a parse first
+            text_expanded = has_refs and (
+                not expand_after or (cached is not None and cached.text_expanded)
+            )
+            payload, source = self._parse_payload(raw, source, text_expanded)
+            digest = (
+                (self.format, hashlib.blake2b(source, digest_size=16).digest())
+                if use_cache else None
+            )
+        except Exception as e:
+            raise ConfigLoadError(f"Invalid {self.format.upper()} in {path}: {e}") from e
+
+        if cached is not None and cached.digest == digest:
+            # Refresh the stamp only if the entry was not evicted or
+            # replaced meanwhile
+            with _FILE_CACHE_LOCK:
+                if _FILE_CACHE.get(resolved) is cached:
+                    _FILE_CACHE[resolved] = cached._replace(stamp=stamp)
+            return copy.deepcopy(cached.data), cached.expand_values, cached.has_enc
+
         try:
-            text = path.read_text(encoding="utf-8-sig")
-            expanded = self._expand_env(text)
-            data = self.parser.parse(expanded)
-            return data or {}
+            try:
+                data = self.parser.parse(payload) or {}
+            except Exception:
+                if text_expanded or not has_refs:
+                    raise
+                # A reference outside a string (`port = ${PORT}`) is not
+                # valid JSON/TOML until expanded: expand the text instead
+                text_expanded = True
+                payload, source = self._parse_payload(raw, source, True)
+                if use_cache:
+                    digest = (self.format, hashlib.blake2b(source, digest_size=16).digest())
+                data = self.parser.parse(payload) or {}
+            has_enc = (_ENC_PREFIX if isinstance(payload, str) else _ENC_PREFIX_BYTES) in payload
         except Exception as e:
             raise ConfigLoadError(f"Invalid {self.format.upper()} in {path}: {e}") from e
 
-    def _expand_env(self, text: str) -> str:
-        def replacer(match):
-            var, default = match.groups()
-            return os.getenv(var, default if default is not None else match.group(0))
+        # References still to expand, in the parsed string values
+        expand_values = has_refs and not text_expanded
+
+        if not use_cache:
+            # Nobody else holds this tree, so no copy is needed
+            return data, expand_values, has_enc
+
+        with _FILE_CACHE_LOCK:
+            if resolved not in _FILE_CACHE:
+                # Dicts keep insertion order: evict the oldest entries
+                while _FILE_CACHE and len(_FILE_CACHE) >= FILE_CACHE_MAX_ENTRIES:
+                    _FILE_CACHE.pop(next(iter(_FILE_CACHE)))
+            _FILE_CACHE[resolved] = _CachedFile(
+                stamp, digest, data, expand_values, has_enc, text_expanded
+            )
+        return copy.deepcopy(data), expand_values, has_enc
+
+    def _parse_payload(self, raw: bytes, source: memoryview, text_expand: bool):
+        """
+        Return (payload for the parser, bytes the digest covers).
+
+        With text_expand, ${...} references are substituted in the file's
+        bytes before parsing: no decode/encode round trip.
+        """
+        if text_expand:
+            expanded = self._expand_env(bytes(source) if len(source) != len(raw) else raw)
+            if self.format in BYTES_PARSE_FORMATS:
+                return expanded, expanded
+            return str(expanded, "utf-8"), expanded
+        if self.format in BYTES_PARSE_FORMATS:
+            # Let the parser decode: no intermediate str for the file
+            return (bytes(source) if len(source) != len(raw) else raw), source
+        return str(source, "utf-8"), source
+
+    def _expand_env(self, text: AnyStr) -> AnyStr:
+        """
+        Expand ${VAR} and ${VAR:default} in a single left-to-right scan.
+
+        Accepts exactly the grammar of ENV_PATTERN: VAR is one or more
+        characters other than '}' and ':', and the default runs to the
+        first '}'. Unresolved references without a default are left as-is.
 
-        return ENV_PATTERN.sub(replacer, text)
+        Works on str or on UTF-8 bytes (a whole YAML file is expanded as
+        bytes, so it never has to be decoded into a str and back).
+        """
+        is_bytes = isinstance(text, bytes)
+        if is_bytes:
+            opener, closer, colon = b"${", b"}", b":"
+        else:
+            opener, closer, colon = "${", "}", ":"
+
+        # Fast path: most values and many files have no references at all.
+        if opener not in text:
+            return text
+
+        start = text.find(opener)
+
+        env = self._env_cache
+        env_get = env.get
+        getenv = os.environ.get
+        parts = []
+        pos = 0
+
+        while start >= 0:
+            end = text.find(closer, start + 2)
+            if end < 0:
+                # No closing brace anywhere after this point.
+                break
+
+            var, sep, default = text[start + 2:end].partition(colon)
+            if not var:
+                # "${}" or "${:...}" is not a reference; keep scanning.
+                start = text.find(opener, start + 2)
+                continue
+
+            if is_bytes:
+                var = var.decode("utf-8")
+
+            parts.append(text[pos:start])
+            value = env_get(var, _UNSET)
+            if value is _UNSET:
+                value = env[var] = getenv(var)
+            if value is None:
+                value = default if sep else text[start:end + 1]
+            elif is_bytes:
+                value = value.encode("utf-8")
+            parts.append(value)
+
+            pos = end + 1
+            start = text.find(opener, pos)
+
+        parts.append(text[pos:])
+        return text[:0].join(parts)
+
+    def _expand_env_in_tree(self, node: Any):
+        """Expand ${...} in every string value (not key) of a parsed tree."""
+        kinds = _WALK_KINDS
+        stack: List[Any] = [node]
+        while stack:
+            container = stack.pop()
+            # Only values are reassigned, so the live view is safe to iterate
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                kind = kinds.get(type(value))
+                if kind is None:
+                    kind = _walk_kind(value)
+
+                if kind == _STRING:
+                    if "${" in value:
+                        container[key] = value = self._expand_env(value)
+                        if _ENC_PREFIX in value:
+                            self._has_enc = True
+                elif kind == _CONTAINER:
+                    stack.append(value)
 
     # ==================================================================
     # IMPORT PROCESSING
@@ -284,16 +680,19 @@ def _record_import(
         import_key: Optional[str],
         depth: int,
     ):
-        self._import_trace.append(
+        # Entries stay plain dicts: a dict display is cheaper to build than
+        # a namedtuple, and _meta.import_trace exposes dicts anyway. The
+        # order is the entry's position, so no separate counter is kept.
+        trace = self._import_trace
+        trace.append(
             {
                 "file": file,
                 "imported_by": imported_by,
                 "import_key": import_key,
                 "depth": depth,
-                "order": self._order,
+                "order": len(trace),
             }
         )
-        self._order += 1
 
     def _apply_imports_recursive(
         self,
@@ -303,80 +702,150 @@ def _apply_imports_recursive(
         depth: int,
         suppress: bool,
         import_chain: Optional[List[str]] = None,
+        wrap_secrets: bool = False,
+        secret_key: Optional[str] = None,
     ):
         if not isinstance(node, dict):
             return
 
-        # Initialize import chain if not provided
+        # Top-level call for a root file (base or profile): it sits at the
+        # bottom of the import stack while its imports are processed.
         if import_chain is None:
-            import_chain = [parent_file]
-
-        if "imports" in node:
-            imports = node.get("imports", [])
-            if not isinstance(imports, list):
-                raise ConfigLoadError("imports must be a list")
-
-            for import_key in imports:
-                import_file = self._resolve_import(import_key)
-                import_path = str(import_file)
-
-                if import_path in self._seen_imports:
-                    # Build the cycle path for a clear error message
-                    cycle_start_idx = import_chain.index(import_path) if import_path in import_chain else -1
-                    if cycle_start_idx >= 0:
-                        cycle_path = import_chain[cycle_start_idx:] + [import_path]
-                    else:
-                        cycle_path = import_chain + [import_path]
-                    cycle_display = " -> ".join(Path(p).name for p in cycle_path)
-                    raise ConfigLoadError(
-                        f"Circular import detected: {cycle_display}\n"
-                        f"File '{Path(import_path).name}' was already imported earlier in the chain."
-                    )
-                self._seen_imports.add(import_path)
+            self._import_stack.add(parent_file)
+            try:
+                self._apply_imports_recursive(
+                    node,
+                    parent_file=parent_file,
+                    depth=depth,
+                    suppress=suppress,
+                    import_chain=[parent_file],
+                    wrap_secrets=wrap_secrets,
+                    secret_key=secret_key,
+                )
+            finally:
+                self._import_stack.discard(parent_file)
+            return
 
-                self._record_import(
-                    file=import_path,
-                    imported_by=parent_file,
-                    import_key=import_key,
-                    depth=depth + 1,
+        # Walk this file's tree with an explicit stack. Only following an
+        # import recurses, so Python recursion depth tracks import depth
+        # rather than how deeply the configuration is nested. Children are
+        # pushed in reverse so nodes are visited in document order, which
+        # keeps import_trace ordering unchanged.
+        kinds = _WALK_KINDS
+        stack: List[Any] = [node]
+        while stack:
+            current = stack.pop()
+
+            if isinstance(current, list):
+                items = enumerate(current)
+            else:
+                if "imports" in current:
+                    self._merge_imports(
+                        current,
+                        current.pop("imports"),
+                        parent_file=parent_file,
+                        depth=depth,
+                        suppress=suppress,
+                        import_chain=import_chain,
+                        wrap_secrets=wrap_secrets,
+                        secret_key=secret_key,
+                    )
+                items = current.items()
+
+            # _has_enc is re-read per container: it becomes true as soon as
+            # a file containing "ENC(" is loaded, which always happens
+            # before that file's tree is walked.
+            wrap = wrap_secrets and self._has_enc
+            children = []
+            for key, value in items:
+                kind = kinds.get(type(value))
+                if kind is None:
+                    kind = _walk_kind(value)
+
+                if kind == _CONTAINER:
+                    children.append(value)
+                elif (
+                    kind == _STRING
+                    and wrap
+                    and value[:1] == "E"
+                    and value[:4] == _ENC_PREFIX
+                    and value[-1] == ")"
+                ):
+                    current[key] = LazySecret.from_body(value[4:-1], secret_key)
+            stack.extend(reversed(children))
+
+    def _merge_imports(
+        self,
+        node: Dict[str, Any],
+        imports: Any,
+        *,
+        parent_file: str,
+        depth: int,
+        suppress: bool,
+        import_chain: List[str],
+        wrap_secrets: bool,
+        secret_key: Optional[str],
+    ):
+        """Load each listed import, apply its own imports, and merge it into node."""
+        if not isinstance(imports, list):
+            raise ConfigLoadError("imports must be a list")
+
+        # Each import is merged into the node as soon as it is loaded.
+        # deep_merge only walks the override, so this is already linear
+        # in the imported data; folding the imports together first would
+        # not be cheaper, and would change the result when a later import
+        # replaces a section that an earlier one turned into a scalar.
+
+        for import_key in imports:
+            # import_path is interned once per key in _resolve_import: the
+            # same string object serves as cache key, stack member and trace
+            # entry, so lookups can short-circuit on identity.
+            import_path = self._resolve_import(import_key)
+
+            # Only a file that is still being processed further up this
+            # chain forms a cycle. Importing the same file from two
+            # different branches (a diamond) is allowed.
+            if import_path in self._import_stack:
+                # Build the cycle path for a clear error message
+                cycle_start_idx = import_chain.index(import_path) if import_path in import_chain else -1
+                if cycle_start_idx >= 0:
+                    cycle_path = import_chain[cycle_start_idx:] + [import_path]
+                else:
+                    cycle_path = import_chain + [import_path]
+                cycle_display = " -> ".join(Path(p).name for p in cycle_path)
+                raise ConfigLoadError(
+                    f"Circular import detected: {cycle_display}\n"
+                    f"File '{Path(import_path).name}' was already imported earlier in the chain."
                 )
 
-                imported_data = self._load_file(import_file)
+            self._record_import(
+                file=import_path,
+                imported_by=parent_file,
+                import_key=import_key,
+                depth=depth + 1,
+            )
 
-                # Extend the import chain for the recursive call
-                extended_chain = import_chain + [import_path]
+            # A file shared by several branches is loaded and merged at
+            # each position; _load_file serves repeats from its cache.
+            imported_data = self._load_file(
+                import_path, import_path, import_key=import_key
+            )
 
+            self._import_stack.add(import_path)
+            try:
                 self._apply_imports_recursive(
                     imported_data,
                     parent_file=import_path,
                     depth=depth + 1,
                     suppress=suppress,
-                    import_chain=extended_chain,
+                    import_chain=import_chain + [import_path],
+                    wrap_secrets=wrap_secrets,
+                    secret_key=secret_key,
                 )
+            finally:
+                self._import_stack.discard(import_path)
 
-                deep_merge(node, imported_data, suppress=suppress)
-
-            del node["imports"]
-
-        for value in node.values():
-            if isinstance(value, dict):
-                self._apply_imports_recursive(
-                    value,
-                    parent_file=parent_file,
-                    depth=depth,
-                    suppress=suppress,
-                    import_chain=import_chain,
-                )
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        self._apply_imports_recursive(
-                            item,
-                            parent_file=parent_file,
-                            depth=depth,
-                            suppress=suppress,
-                            import_chain=import_chain,
-                        )
+            deep_merge(node, imported_data, suppress=suppress)
 
     # ==================================================================
     # SECRETS
@@ -385,19 +854,28 @@ def _apply_imports_recursive(
     # NOTE:
     # APP_SECRET_KEY is intentionally read directly from os.getenv()
     # and never stored on ConfigLoader or Config objects.
+    # load() reads it once and passes it down as an argument, so it
+    # lives only for the duration of this walk.
     # This minimizes secret lifetime and prevents accidental leakage.
-    def _inject_secrets(self, data: Dict[str, Any]):
-        for key, value in list(data.items()):
-            if isinstance(value, str) and value.startswith("ENC(") and value.endswith(")"):
-                data[key] = LazySecret(value, key=os.getenv("APP_SECRET_KEY"))
-            elif isinstance(value, dict):
-                self._inject_secrets(value)
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if isinstance(item, str) and item.startswith("ENC(") and item.endswith(")"):
-                        value[i] = LazySecret(item, key=os.getenv("APP_SECRET_KEY"))
-                    elif isinstance(item, dict):
-                        self._inject_secrets(item)
+    def _inject_secrets(self, data: Dict[str, Any], secret_key: Optional[str]):
+        kinds = _WALK_KINDS
+        stack: List[Any] = [data]
+        while stack:
+            container = stack.pop()
+            # Only values are reassigned, never keys added or removed, so
+            # iterating the live dict view is safe and avoids a copy.
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                kind = kinds.get(type(value))
+                if kind is None:
+                    kind = _walk_kind(value)
+
+                if kind == _STRING:
+                    # A 4-char prefix match guarantees value[-1] exists.
+                    if value[:1] == "E" and value[:4] == _ENC_PREFIX and value[-1] == ")":
+                        container[key] = LazySecret.from_body(value[4:-1], secret_key)
+                elif kind == _CONTAINER:
+                    stack.append(value)
 
     # ==================================================================
     # METADATA
@@ -408,5 +886,6 @@ def _inject_metadata(self, merged: dict):
         meta = node.setdefault("_meta", {})
 
         meta.setdefault("profile", self.profile or "default")
-        meta.setdefault("sources", list(self._merge_trace))
-        meta.setdefault("import_trace", list(self._import_trace))
+        # No defensive copies: Config rebuilds every list and dict it wraps
+        meta.setdefault("sources", self._merge_trace)
+        meta.setdefault("import_trace", self._import_trace)
@@ -4,7 +4,7 @@
 from pathlib import Path
 import threading
 
-from .config_loader import ConfigLoader
+from .config_loader import ConfigLoader, clear_file_cache
 from .config import Config
 from .exceptions import ConfigLoadError
 
@@ -64,12 +64,16 @@ def get(cls) -> Config:
         If not initialized, this is a programming error — the application
         MUST initialize configuration during startup (e.g., create_app()).
         """
-        if cls._instance is None:
+        # Lock-free: _instance is only ever swapped as a whole reference.
+        # Reading it once means a concurrent _clear_all() between the check
+        # and the return cannot make get() hand back None.
+        instance = cls._instance
+        if instance is None:
             raise ConfigLoadError(
                 "ConfigSingleton.get() called before initialize(). "
                 "You must call ConfigSingleton.initialize(profile, config_dir) first."
             )
-        return cls._instance
+        return instance
 
     @classmethod
     def _clear_all(cls):
@@ -80,3 +84,4 @@ def _clear_all(cls):
             cls._instance = None
             cls._profile = None
             cls._config_dir = None
+            clear_file_cache()
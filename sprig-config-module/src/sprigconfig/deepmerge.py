@@ -25,10 +25,10 @@ def deep_merge(
     base: Dict[str, Any], override: Dict[str, Any], *, suppress=False, path=""
 ) -> Dict[str, Any]:
     """
-    Recursively deep-merge override → base, modifying base in-place.
+    Deep-merge override → base, modifying base in-place.
 
     RULES:
-    - If both values are dicts → recurse.
+    - If both values are dicts → merge their contents.
     - If both values are lists → override entirely.
     - If override is scalar → replace.
     - If key not present in base → add.
@@ -37,30 +37,62 @@ def deep_merge(
     Returns:
         The modified base dict (for chaining).
     """
-    for key, value in override.items():
-        current_path = f"{path}{key}"
-
-        # Both are dicts → recursive merge
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            # Warn for missing keys (partial override)
-            if not suppress:
-                missing = set(base[key].keys()) - set(value.keys())
-                if missing:
-                    logger.warning(
-                        f"Config section '{current_path}' partially overridden; "
-                        f"missing keys: {missing}"
-                    )
+    # Nothing below WARNING is emitted here, so a logger that drops
+    # warnings needs no missing-key sets or key paths at all.
+    report = not suppress and logger.isEnabledFor(logging.WARNING)
+    log_info = report and logger.isEnabledFor(logging.INFO)
 
-            deep_merge(base[key], value, suppress=suppress, path=current_path + ".")
+    # Leaf-only overrides (typical of profile overlays) need no per-key
+    # work unless each key is to be logged: one dict.update() does it.
+    if not log_info and _all_leaves(override):
+        base.update(override)
+        return base
 
-        else:
-            # Value replaced or added
-            if key in base and base[key] != value and not suppress:
-                logger.info(f"Overriding config '{current_path}'")
-            elif key not in base and not suppress:
-                logger.info(f"Adding new config '{current_path}'")
+    # Depth-first walk with an explicit stack of item iterators instead of
+    # recursion. Each frame resumes where it left off, so keys are visited
+    # (and logged) in exactly the order the recursive version used.
+    stack = [(base, iter(override.items()), path)]
+    while stack:
+        target, items, prefix = stack[-1]
+        for key, value in items:
+            # Both are dicts → merge one level deeper
+            if key in target:
+                existing = target[key]
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    # Warn for missing keys (partial override)
+                    if report:
+                        missing = existing.keys() - value.keys()
+                        if missing:
+                            logger.warning(
+                                "Config section '%s%s' partially overridden; "
+                                "missing keys: %s",
+                                prefix, key, missing,
+                            )
+                    if not log_info and _all_leaves(value):
+                        existing.update(value)
+                        continue
+                    stack.append(
+                        (existing, iter(value.items()), f"{prefix}{key}." if report else "")
+                    )
+                    break
+
+                # Value replaced
+                if log_info and existing != value:
+                    logger.info("Overriding config '%s%s'", prefix, key)
+            elif log_info:
+                logger.info("Adding new config '%s%s'", prefix, key)
 
             # Replace or add
-            base[key] = value
+            target[key] = value
+        else:
+            stack.pop()
 
     return base
+
+
+def _all_leaves(override: Dict[str, Any]) -> bool:
+    """True if no value in override is a dict (nothing to merge into)."""
+    for value in override.values():
+        if isinstance(value, dict):
+            return False
+    return True
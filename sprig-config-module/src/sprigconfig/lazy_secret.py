@@ -7,11 +7,17 @@
 need for external modules to modify private state.
 """
 
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable, Union
+import functools
 import os
-from cryptography.fernet import Fernet, InvalidToken
 from .exceptions import ConfigLoadError
 
+# The Fernet implementation (rfernet if installed, else cryptography and
+# its OpenSSL bindings) is imported on first use, so configs without
+# ENC(...) values never pay for loading it.
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 # ---------------------------------------------------------------------------
 # Global key management (new public API)
 # ---------------------------------------------------------------------------
@@ -20,6 +26,41 @@
 _KEY_PROVIDER: Optional[Callable[[], Optional[str]]] = None
 
 
+@functools.lru_cache(maxsize=None)
+def _fernet_backend() -> tuple:
+    """
+    Return (Fernet class, decrypt error types, takes str keys only).
+
+    The Rust-backed rfernet is used when it is installed; cryptography is
+    the fallback. Both share the same token format. An rfernet release
+    without ``DecryptionError`` is not used, since bad tokens could then
+    not be told apart from other errors.
+    """
+    try:
+        import rfernet
+
+        return rfernet.Fernet, (rfernet.DecryptionError,), True
+    except (ImportError, AttributeError):
+        from cryptography.fernet import Fernet, InvalidToken
+
+        return Fernet, (InvalidToken,), False
+
+
+@functools.lru_cache(maxsize=8)
+def _fernet_for(key: Union[str, bytes]) -> "Fernet":
+    """
+    Return a Fernet instance for ``key``, shared by every secret using it.
+
+    Fernet decodes and splits the key on construction; a config usually has
+    one key for all of its ENC(...) values, so this is done once per key
+    rather than once per decrypt. Invalid keys raise and are not cached.
+    """
+    fernet_cls, _, str_keys = _fernet_backend()
+    if str_keys and isinstance(key, bytes):
+        key = key.decode("ascii")
+    return fernet_cls(key)
+
+
 def set_global_key(key: str) -> None:
     """
     Set the global Fernet key used by all LazySecret instances.
@@ -36,7 +77,7 @@ def set_global_key(key: str) -> None:
 
     # Validate key immediately
     try:
-        Fernet(key)
+        _fernet_for(key)
     except Exception as e:
         raise ConfigLoadError(f"Invalid Fernet key format: {e}")
 
@@ -131,23 +172,38 @@ class LazySecret:
 
     def __init__(self, enc_value: str, key: Optional[str] = None):
         # Defensive: tolerate ENC(...) or raw value
-        if isinstance(enc_value, str) and enc_value.startswith("ENC(") and enc_value.endswith(")"):
+        if isinstance(enc_value, str) and enc_value[:4] == "ENC(" and enc_value[-1:] == ")":
             self._encrypted_value = enc_value[4:-1]
         else:
             self._encrypted_value = enc_value
         self._decrypted_value = None
         self._key = key
 
+    @classmethod
+    def from_body(cls, body: str, key: Optional[str] = None) -> "LazySecret":
+        """
+        Build a LazySecret from the text between "ENC(" and ")".
+
+        Used by ConfigLoader, which has already matched the ENC(...)
+        wrapper, so the checks in __init__ would only repeat that work.
+        """
+        secret = cls.__new__(cls)
+        secret._encrypted_value = body
+        secret._decrypted_value = None
+        secret._key = key
+        return secret
+
     def _decrypt(self):
         if self._decrypted_value is not None:
             return self._decrypted_value
 
         key = _resolve_key(self._key)
+        fernet = _fernet_for(key)
+        _, invalid_token, _ = _fernet_backend()
         try:
-            fernet = Fernet(key.encode() if isinstance(key, str) else key)
             self._decrypted_value = fernet.decrypt(self._encrypted_value.encode()).decode()
             return self._decrypted_value
-        except InvalidToken as e:
+        except invalid_token as e:
             raise ConfigLoadError(f"Invalid Fernet key or ciphertext: {e}")
 
     def get(self) -> str:
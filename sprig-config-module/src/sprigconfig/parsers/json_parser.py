@@ -1,7 +1,22 @@
 import json
 
+# orjson is optional and only used when installed.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
 class JsonParser:
-    def parse(self, text: str):
+    def parse(self, text: str | bytes):
+        if orjson is not None:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # Retry with the stdlib for inputs orjson rejects but json
+                # accepts (NaN/Infinity, integers wider than 64 bits), and
+                # for its error messages on genuinely invalid documents.
+                pass
         try:
             return json.loads(text)
         except json.JSONDecodeError as e:
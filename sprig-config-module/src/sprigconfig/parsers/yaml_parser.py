@@ -1,8 +1,30 @@
+import logging
+
 import yaml
 
+logger = logging.getLogger(__name__)
+# Without this, the import-time warning below would reach logging's
+# last-resort handler and print to stderr in applications that never
+# configured logging. Configured applications still receive it.
+logger.addHandler(logging.NullHandler())
+
+# The safe loader and dumper used throughout SprigConfig: libyaml's C
+# implementations when PyYAML was built with it, which handle the same
+# safe subset of YAML as the pure-Python SafeLoader and SafeDumper.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader, SafeDumper
+
+    logger.warning(
+        "PyYAML was built without libyaml; falling back to the pure-Python "
+        "SafeLoader. Install libyaml and reinstall PyYAML for faster loading."
+    )
+
+
 class YamlParser:
-    def parse(self, text: str):
+    def parse(self, text: str | bytes):
         try:
-            return yaml.safe_load(text)
+            return yaml.load(text, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(str(e))
@@ -1,4 +1,5 @@
 # tests/conftest.py
+import io
 import os
 import logging
 import sys
@@ -7,9 +8,19 @@
 from dotenv import dotenv_values, load_dotenv
 import pytest
 import json
+import math
 import yaml
 import shutil
 
+from sprigconfig.parsers.yaml_parser import SafeDumper
+
+# orjson is optional; _orjson_dumps() uses it only where its output matches
+# the stdlib encoder's.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 pytest_plugins = [
     "pytester",
 ]
@@ -167,11 +178,15 @@ def _load_raw_config(profile=None, config_dir=None):
 # GLOBAL TEST LOGGING
 # =====================================================================
 
-@pytest.fixture(scope="session", autouse=True)
-def configure_test_logging():
+def pytest_configure(config):
     """
     Mirror old behavior: detailed timestamped log file + console output.
+    Runs once per pytest session; the flag on the config object turns a
+    repeat call for the same session into a no-op.
     """
+    if getattr(config, "_sprig_logging_ready", False):
+        return
+
     log_dir = Path("test_logs")
     log_dir.mkdir(exist_ok=True)
 
@@ -200,9 +215,8 @@ def configure_test_logging():
     root.addHandler(console_handler)
     root.addHandler(file_handler)
 
+    config._sprig_logging_ready = True
     logging.getLogger(__name__).info("Test logging configured. File: %s", logfile)
-    yield
-    logging.getLogger(__name__).info("Tests finished. Logs written to %s", logfile)
 
 
 # =====================================================================
@@ -229,7 +243,8 @@ def pytest_addoption(parser):
         "--debug-dump",
         action="store",
         default=None,
-        help="Write fully merged Config to the given YAML file (safe, redacted).",
+        help="Write fully merged Config to the given file (safe, redacted); "
+             "JSON for .json/.ndjson paths, YAML otherwise.",
     )
 
 
@@ -246,39 +261,152 @@ def pytest_collection_modifyitems(config, items):
 # SAFE SERIALIZATION HELPERS
 # =====================================================================
 
+# Exact-type dispatch for _to_plain: the output container type for
+# containers, None for scalars that pass through unchanged. Anything else
+# (LazySecret, Config, subclasses) takes the isinstance/to_dict path.
+_PLAIN_KINDS = {
+    dict: dict,
+    list: list,
+    tuple: list,
+    set: list,
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+_PLAIN_UNKNOWN = object()
+
+
 def _to_plain(obj, resolve_secrets=False, redact=True):
     """
     Convert Config and LazySecret structures to safe plain dict.
+
+    Iterative: each container is created empty, and filled when it is
+    popped off the work stack, so nesting depth costs no Python frames.
+    Builtin types are classified with one lookup in _PLAIN_KINDS.
     """
-    # LazySecret
-    if isinstance(obj, LazySecret):
-        if resolve_secrets:
-            return "****" if redact else obj.get()
-        return "<LazySecret>"
+    def convert(value):
+        # -> (plain value, source container still to copy into it, or None)
+        kind = _PLAIN_KINDS.get(type(value), _PLAIN_UNKNOWN)
+        if kind is None:
+            return value, None
+        if kind is _PLAIN_UNKNOWN:
+            # LazySecret
+            if isinstance(value, LazySecret):
+                if resolve_secrets:
+                    return ("****" if redact else value.get()), None
+                return "<LazySecret>", None
+
+            # New Config object: walk its data in place (no to_dict() copy),
+            # which also leaves its LazySecret values for the branch above
+            if hasattr(value, "_to_dict_view"):
+                value = value._to_dict_view()
+            elif hasattr(value, "to_dict"):
+                value = value.to_dict()
+
+            if isinstance(value, dict):
+                kind = dict
+            elif isinstance(value, (list, tuple, set)):
+                kind = list
+            else:
+                return value, None
+        return ({} if kind is dict else []), value
+
+    root, source = convert(obj)
+    stack = [(root, source)] if source is not None else []
+    while stack:
+        out, source = stack.pop()
+        if type(out) is dict:
+            for key, value in source.items():
+                out[key], child = convert(value)
+                if child is not None:
+                    stack.append((out[key], child))
+        else:
+            append = out.append
+            for value in source:
+                plain, child = convert(value)
+                append(plain)
+                if child is not None:
+                    stack.append((plain, child))
+    return root
+
+
+def dump_config_to(stream, cfg, *, fmt="yaml", resolve_secrets=False, redact=True):
+    """Write config as YAML or JSON to a text stream without building a string."""
+    plain = _to_plain(cfg, resolve_secrets=resolve_secrets, redact=redact)
+    if fmt == "yaml":
+        yaml.dump(plain, stream, Dumper=SafeDumper, sort_keys=False)
+    else:
+        _json_dump_to(stream, plain)
 
-    # New Config object
-    if hasattr(obj, "to_dict"):
-        obj = obj.to_dict()
 
-    # Dict
-    if isinstance(obj, dict):
-        return {k: _to_plain(v, resolve_secrets, redact) for k, v in obj.items()}
+def dump_config(cfg, *, fmt="yaml", resolve_secrets=False, redact=True):
+    """Render config to YAML or JSON cleanly."""
+    buf = io.StringIO()
+    dump_config_to(buf, cfg, fmt=fmt, resolve_secrets=resolve_secrets, redact=redact)
+    return buf.getvalue()
 
-    # List / tuple
-    if isinstance(obj, (list, tuple, set)):
-        return [_to_plain(v, resolve_secrets, redact) for v in obj]
 
-    return obj
+def _json_dumps(plain, *, indent=True, default=None) -> str:
+    """json.dumps via orjson when it would write the same data; stdlib otherwise."""
+    text = _orjson_dumps(plain, indent=indent, default=default)
+    if text is None:
+        text = json.dumps(plain, indent=2 if indent else None, default=default)
+    return text
 
 
-def dump_config(cfg, *, fmt="yaml", resolve_secrets=False, redact=True):
-    """Render config to YAML or JSON cleanly."""
-    plain = _to_plain(cfg, resolve_secrets=resolve_secrets, redact=redact)
-    return (
-        yaml.safe_dump(plain, sort_keys=False)
-        if fmt == "yaml"
-        else json.dumps(plain, indent=2)
-    )
+def _json_dump_to(stream, plain, *, indent=True, default=None):
+    """
+    Like _json_dumps, but written to a text stream. The stdlib encoder
+    writes in chunks; orjson can only produce the whole document at once.
+    """
+    text = _orjson_dumps(plain, indent=indent, default=default)
+    if text is None:
+        json.dump(plain, stream, indent=2 if indent else None, default=default)
+    else:
+        stream.write(text)
+
+
+def _orjson_dumps(plain, *, indent, default):
+    """
+    orjson's encoding of `plain`, or None where it would differ from json's.
+
+    orjson writes NaN/Infinity as null without raising and leaves non-ASCII
+    text unescaped. Trees holding either, or any non-JSON type (which
+    `default` would otherwise handle differently), are left to the stdlib.
+    """
+    if orjson is None or not _orjson_matches_stdlib(plain):
+        return None
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(plain, option=option, default=default).decode()
+    except TypeError:
+        return None
+
+
+def _orjson_matches_stdlib(plain) -> bool:
+    """True if every key and value is ASCII str, int, finite float, bool or None."""
+    stack = [plain]
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+        if kind is dict:
+            for key in node:
+                if type(key) is not str or not key.isascii():
+                    return False
+            stack.extend(node.values())
+        elif kind is list:
+            stack.extend(node)
+        elif kind is str:
+            if not node.isascii():
+                return False
+        elif kind is float:
+            if not math.isfinite(node):
+                return False
+        elif kind not in (int, bool, type(None)):
+            return False
+    return True
 
 
 # =====================================================================
@@ -288,7 +416,8 @@ def dump_config(cfg, *, fmt="yaml", resolve_secrets=False, redact=True):
 @pytest.fixture
 def maybe_dump(request):
     """
-    Legacy debug print (to stdout).
+    Legacy debug print (to stdout). Returns the printed text, or "" when
+    --dump-config is not set.
     """
     def _dump(cfg, *, fmt=None, resolve_secrets=None, redact=None):
         if not request.config.getoption("--dump-config"):
@@ -338,7 +467,29 @@ def _capture(loader_callable):
     if dump_path and "cfg" in captured:
         plain = _to_plain(captured["cfg"], resolve_secrets=False, redact=True)
         with open(dump_path, "w") as f:
-            yaml.safe_dump(plain, f, sort_keys=False)
+            fmt = _debug_dump_format(dump_path)
+            if fmt == "ndjson":
+                # One document per line
+                _json_dump_to(f, plain, indent=False, default=str)
+                f.write("\n")
+            elif fmt == "json":
+                _json_dump_to(f, plain, default=str)
+            else:
+                yaml.dump(plain, f, Dumper=SafeDumper, sort_keys=False)
+
+
+def _debug_dump_format(dump_path) -> str:
+    """
+    JSON for .json paths (single-line for .ndjson), or for any path when
+    SPRIG_DEBUG_DUMP_FMT=json; YAML otherwise. JSON encodes far faster
+    than YAML, and the dump is for inspection, not for editing.
+    """
+    suffix = Path(dump_path).suffix.lower()
+    if suffix in (".json", ".ndjson"):
+        return suffix[1:]
+    if os.getenv("SPRIG_DEBUG_DUMP_FMT", "").strip().lower() == "json":
+        return "json"
+    return "yaml"
 
 @pytest.fixture(scope="session", autouse=True)
 def load_env(resolved_env_path):
@@ -1,5 +1,7 @@
 # tests/test_cli.py
 
+import contextlib
+import io
 import json
 import logging
 import subprocess
@@ -11,7 +13,7 @@
 @pytest.fixture(autouse=True)
 def disable_logging_handlers():
     """
-    Disable global logging handlers inside the subprocess.
+    Disable global logging handlers while the CLI runs.
     The CLI should run with a clean stdout environment.
     """
     # Save and remove handlers
@@ -27,7 +29,23 @@ def disable_logging_handlers():
         root.addHandler(h)
 
 def run_cli(args, cwd):
-    """Run the sprigconfig CLI and return (rc, stdout, stderr)."""
+    """Run the sprigconfig CLI in-process and return (rc, stdout, stderr)."""
+    from sprigconfig.cli import main
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    rc = 0
+    with contextlib.chdir(cwd), \
+            contextlib.redirect_stdout(stdout), \
+            contextlib.redirect_stderr(stderr):
+        try:
+            main(list(args))
+        except SystemExit as e:
+            rc = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return rc, stdout.getvalue(), stderr.getvalue()
+
+
+def run_cli_subprocess(args, cwd):
+    """Run ``python -m sprigconfig.cli`` and return (rc, stdout, stderr)."""
     proc = subprocess.Popen(
         [sys.executable, "-m", "sprigconfig.cli"] + args,
         cwd=cwd,
@@ -39,6 +57,20 @@ def run_cli(args, cwd):
     return proc.returncode, stdout, stderr
 
 
+@pytest.mark.slow
+def test_cli_module_entry_point(tmp_path):
+    """``python -m sprigconfig.cli`` is wired to ``main()``."""
+    (tmp_path / "application.yml").write_text("app:\n  name: entry-app\n")
+
+    rc, out, err = run_cli_subprocess(
+        ["dump", "--config-dir", str(tmp_path), "--profile", "dev"],
+        cwd=tmp_path,
+    )
+
+    assert rc == 0
+    assert "name: entry-app" in out
+
+
 def test_cli_dump_basic(tmp_path):
     # Write basic config
     (tmp_path / "application.yml").write_text(
@@ -69,3 +101,67 @@ def test_cli_output_file(tmp_path):
     assert rc == 0
     assert out_file.exists()
     assert "y: 2" in out_file.read_text()
+
+
+def test_cli_dump_redacts_secrets(tmp_path):
+    (tmp_path / "application.yml").write_text(
+        "db:\n  password: ENC(abc)\nkeys:\n  - ENC(def)\n"
+    )
+
+    for fmt in ("yaml", "json"):
+        rc, out, err = run_cli(
+            ["dump", "--config-dir", str(tmp_path), "--profile", "dev",
+             "--output-format", fmt],
+            cwd=tmp_path,
+        )
+
+        assert rc == 0
+        assert out.count("<LazySecret>") == 2
+        assert "ENC(" not in out
+        assert "!!python" not in out
+
+
+def test_cli_json_output_file(tmp_path):
+    (tmp_path / "application.yml").write_text("app:\n  name: json-app\n  port: 8080\n")
+
+    out_file = tmp_path / "out.json"
+
+    rc, out, err = run_cli(
+        ["dump", "--config-dir", str(tmp_path), "--profile", "dev",
+         "--output-format", "json", "--output", str(out_file)],
+        cwd=tmp_path,
+    )
+
+    assert rc == 0
+    data = json.loads(out_file.read_text(encoding="utf-8"))
+    assert data["app"]["name"] == "json-app"
+    assert data["app"]["port"] == 8080
+
+
+def test_cli_json_output_matches_stdlib_encoding(tmp_path):
+    (tmp_path / "application.yml").write_text(
+        "vals:\n  inf: .inf\n  nan: .nan\n  name: café\n", encoding="utf-8"
+    )
+
+    rc, out, err = run_cli(
+        ["dump", "--config-dir", str(tmp_path), "--profile", "dev",
+         "--output-format", "json"],
+        cwd=tmp_path,
+    )
+
+    assert rc == 0
+    assert '"inf": Infinity' in out
+    assert '"nan": NaN' in out
+    assert '"name": "caf\\u00e9"' in out
+
+
+def test_cli_load_error_exits_with_code_2(tmp_path):
+    (tmp_path / "application.yml").write_text("app: [unclosed\n")
+
+    rc, out, err = run_cli(
+        ["dump", "--config-dir", str(tmp_path), "--profile", "dev"],
+        cwd=tmp_path,
+    )
+
+    assert rc == 2
+    assert err.startswith("Error:")
@@ -131,6 +131,17 @@ def test_to_dict_recursively_converts_nested_config():
     assert d == {"a": {"b": 1}}
 
 
+def test_to_dict_view_returns_internal_data_uncopied():
+    secret = LazySecret("ENC(xxx)", key=None)
+    cfg = Config({"a": {"b": 1}, "secret": secret})
+
+    view = cfg._to_dict_view()
+    assert view is cfg._to_dict_view()
+    assert view["a"] == {"b": 1}
+    # Secrets are left for the serializer to handle
+    assert view["secret"] is secret
+
+
 # ----------------------------------------------------------------------
 # DUMP (SAFE)
 # ----------------------------------------------------------------------
@@ -231,3 +231,64 @@ def test_deep_merge_function_still_supports_dicts(config_dir):
 
     result = deep_merge(base, override)
     assert result == {"a": {"b": 1, "c": 2}, "x": 7}
+
+
+# ----------------------------------------------------------------------
+# SEQUENTIAL IMPORT MERGES
+# ----------------------------------------------------------------------
+
+def test_imports_merge_sequentially_not_folded(tmp_path):
+    """
+    Each import is merged into the node in turn. A section replaced by a
+    scalar in one import and re-declared in the next must not resurrect
+    the base section's keys.
+    """
+    (tmp_path / "imports").mkdir()
+    (tmp_path / "application.yml").write_text(
+        "imports:\n  - imports/a\n  - imports/b\nx:\n  old: 1\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "imports" / "a.yml").write_text("x: 1\n", encoding="utf-8")
+    (tmp_path / "imports" / "b.yml").write_text("x:\n  new: 2\n", encoding="utf-8")
+
+    cfg = ConfigLoader(tmp_path, profile="dev").load()
+
+    assert cfg.get("x").to_dict() == {"new": 2}
+
+
+# ----------------------------------------------------------------------
+# DEEP NESTING
+# ----------------------------------------------------------------------
+
+def test_deep_merge_handles_nesting_beyond_recursion_limit(caplog):
+    """
+    deep_merge walks nested dicts iteratively, so nesting deeper than the
+    interpreter's recursion limit merges without RecursionError, and log
+    messages still carry the full dotted path.
+    """
+    import logging
+    import sys
+    from sprigconfig import deep_merge
+
+    depth = sys.getrecursionlimit() + 100
+
+    def nested(leaf):
+        node = leaf
+        for _ in range(depth):
+            node = {"n": node}
+        return node
+
+    base = nested({"keep": 1, "v": 1})
+    override = nested({"v": 2})
+
+    with caplog.at_level(logging.INFO, logger="sprigconfig.deepmerge"):
+        deep_merge(base, override)
+
+    node = base
+    for _ in range(depth):
+        node = node["n"]
+    assert node == {"keep": 1, "v": 2}
+    assert any(
+        r.getMessage() == "Overriding config '" + "n." * depth + "v'"
+        for r in caplog.records
+    )
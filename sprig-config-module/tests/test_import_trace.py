@@ -114,3 +114,59 @@ def test_import_trace_import_key(full_config_dir):
     expected_keys = _load_import_list(full_config_dir / "application.yml")
 
     assert job_entry["import_key"] in expected_keys
+
+
+def test_import_trace_diamond_import_is_not_circular(tmp_path):
+    """
+    A file imported from two branches is merged at both positions and
+    traced once per import; it is not a circular import.
+    """
+    (tmp_path / "imports").mkdir()
+    (tmp_path / "application.yml").write_text(
+        "imports:\n  - imports/a\n  - imports/b\n", encoding="utf-8"
+    )
+    (tmp_path / "imports" / "a.yml").write_text(
+        "a:\n  imports:\n    - imports/shared\n", encoding="utf-8"
+    )
+    (tmp_path / "imports" / "b.yml").write_text(
+        "b:\n  imports:\n    - imports/shared\n", encoding="utf-8"
+    )
+    (tmp_path / "imports" / "shared.yml").write_text("value: 1\n", encoding="utf-8")
+
+    cfg = ConfigLoader(config_dir=tmp_path, profile="dev").load()
+
+    assert cfg.get("a.value") == 1
+    assert cfg.get("b.value") == 1
+
+    trace = cfg.get("sprigconfig._meta.import_trace")
+    shared = (tmp_path / "imports" / "shared.yml").resolve()
+    importers = [
+        Path(e["imported_by"]).name for e in trace if e["file"] == str(shared)
+    ]
+    assert importers == ["a.yml", "b.yml"]
+
+
+def test_import_trace_order_with_many_imports(tmp_path):
+    """
+    With many imports (one listed twice), merge order, trace order and
+    sources must follow the listed order.
+    """
+    (tmp_path / "imports").mkdir()
+    names = ["a", "b", "c", "d", "e", "a"]
+    (tmp_path / "application.yml").write_text(
+        "imports:\n" + "".join(f"  - imports/{n}\n" for n in names),
+        encoding="utf-8",
+    )
+    for n in set(names):
+        (tmp_path / "imports" / f"{n}.yml").write_text(
+            f"last: {n}\n{n}:\n  seen: true\n", encoding="utf-8"
+        )
+
+    cfg = ConfigLoader(config_dir=tmp_path, profile="dev").load()
+
+    assert cfg.get("last") == "a"
+    assert all(cfg.get(f"{n}.seen") for n in names)
+
+    trace = cfg.get("sprigconfig._meta.import_trace")
+    assert [Path(e["file"]).stem for e in trace[1:]] == names
+    assert cfg.get("sprigconfig._meta.sources") == [e["file"] for e in trace]
@@ -151,6 +151,58 @@ def test_env_var_empty_default_expands_to_empty_string_json(monkeypatch, config_
     assert cfg.get("env.empty_default") == ""
 
 
+def test_env_value_with_quotes_does_not_break_json(monkeypatch, config_dir):
+    """JSON is expanded after parsing, so values are not re-tokenized."""
+    monkeypatch.setenv("TEST_VALUE", 'say "hi" \\ bye')
+
+    cfg = ConfigLoader(config_dir, profile="envtest", config_format="json").load()
+
+    assert cfg.get("env.expanded") == 'say "hi" \\ bye'
+
+
+@pytest.mark.parametrize(
+    "fmt, text",
+    [
+        ("toml", "port = ${SPRIG_TEST_PORT}\nname = \"${SPRIG_TEST_NAME:svc}\"\n"),
+        ("json", '{"port": ${SPRIG_TEST_PORT}, "name": "${SPRIG_TEST_NAME:svc}"}'),
+    ],
+)
+def test_unquoted_env_reference_still_expands_as_text(monkeypatch, tmp_path, fmt, text):
+    """A reference outside a string falls back to text-level expansion."""
+    (tmp_path / f"application.{fmt}").write_text(text, encoding="utf-8")
+    monkeypatch.setenv("SPRIG_TEST_PORT", "8080")
+
+    for _ in range(2):  # second load goes through the parsed-file cache
+        cfg = ConfigLoader(tmp_path, profile="dev", config_format=fmt).load()
+        assert cfg.get("port") == 8080
+        assert cfg.get("name") == "svc"
+
+    monkeypatch.setenv("SPRIG_TEST_PORT", "9090")
+    cfg = ConfigLoader(tmp_path, profile="dev", config_format=fmt).load()
+    assert cfg.get("port") == 9090
+
+
+def test_expand_env_matches_reference_grammar(monkeypatch, config_dir):
+    """Edge cases of the ${VAR[:default]} scanner."""
+    monkeypatch.setenv("TEST_VALUE", "xyz")
+    monkeypatch.delenv("UNSET_VAR", raising=False)
+    expand = ConfigLoader(config_dir, profile="dev")._expand_env
+
+    plain = "plain text"
+    assert expand(plain) is plain  # no-reference fast path returns input
+    assert expand("a${TEST_VALUE}b${TEST_VALUE}") == "axyzbxyz"
+    assert expand("${UNSET_VAR}") == "${UNSET_VAR}"
+    assert expand("${UNSET_VAR:x:y}") == "x:y"
+    assert expand("${} ${:d} ${TEST_VALUE") == "${} ${:d} ${TEST_VALUE"
+    assert expand("$${TEST_VALUE}}") == "$xyz}"
+
+    # Whole YAML files are expanded as UTF-8 bytes with the same grammar
+    monkeypatch.setenv("TEST_VALUE_UTF8", "xéz")
+    assert expand("a: ${TEST_VALUE_UTF8} ${UNSET_VAR} ${UNSET_VAR:d}".encode()) == (
+        "a: xéz ${UNSET_VAR} d".encode()
+    )
+
+
 # ----------------------------------------------------------------------
 # SECRET HANDLING
 # ----------------------------------------------------------------------
@@ -184,6 +236,148 @@ def test_integration_secret_decryption(monkeypatch, config_dir, tmp_path):
     assert source_secrets_yml.read_text(encoding="utf-8") == source_before
 
 
+@pytest.mark.parametrize("fmt", ["yml", "json"])
+def test_integration_secret_from_env_is_wrapped(monkeypatch, config_dir, fmt):
+    """An ENC(...) value that only appears after env expansion is still wrapped."""
+    monkeypatch.setenv("TEST_VALUE", "ENC(not-a-real-token)")
+
+    cfg = ConfigLoader(config_dir, profile="envtest", config_format=fmt).load()
+
+    assert isinstance(cfg.get("env.expanded"), LazySecret)
+
+
+def test_integration_secrets_wrapped_in_imports_and_nested_lists(tmp_path):
+    (tmp_path / "imports").mkdir()
+    (tmp_path / "application.yml").write_text(
+        "imports:\n  - imports/creds\nkeys:\n  - [ENC(a)]\n  - {x: ENC(b)}\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "imports" / "creds.yml").write_text(
+        "db:\n  password: ENC(c)\n", encoding="utf-8"
+    )
+
+    cfg = ConfigLoader(tmp_path, profile="dev").load()
+
+    keys = cfg.get("keys")
+    assert isinstance(keys[0][0], LazySecret)
+    assert isinstance(keys[1]["x"], LazySecret)
+    assert isinstance(cfg.get("db.password"), LazySecret)
+
+
+def test_importing_sprigconfig_does_not_load_cryptography():
+    """cryptography is only imported when a secret is actually decrypted."""
+    import subprocess
+    import sys
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import sprigconfig; "
+        "sys.exit('cryptography' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code, str(src)])
+    assert result.returncode == 0
+
+
+@pytest.mark.parametrize("configure_logging", [True, False])
+def test_libyaml_fallback_warning_reaches_configured_logging_only(configure_logging):
+    """Without libyaml the import warns, but never via the last-resort handler."""
+    import subprocess
+    import sys
+
+    src = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, logging, yaml; sys.path.insert(0, sys.argv[1]); "
+        "del yaml.CSafeLoader, yaml.CSafeDumper; "
+        + ("logging.basicConfig(); " if configure_logging else "")
+        + "import sprigconfig"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code, str(src)], capture_output=True, text=True
+    )
+    assert result.returncode == 0
+    assert ("without libyaml" in result.stderr) is configure_logging
+
+
+@pytest.fixture
+def fake_rfernet(monkeypatch):
+    """Install a stand-in rfernet module backed by cryptography."""
+    import sys
+    import types
+    from cryptography.fernet import Fernet, InvalidToken
+    from sprigconfig import lazy_secret
+
+    module = types.ModuleType("rfernet")
+
+    class DecryptionError(Exception):
+        pass
+
+    class FakeFernet:
+        def __init__(self, key):
+            if not isinstance(key, str):
+                raise TypeError("key must be str")
+            self._inner = Fernet(key.encode())
+
+        def decrypt(self, token):
+            try:
+                return self._inner.decrypt(token)
+            except InvalidToken:
+                raise DecryptionError("bad token") from None
+
+    module.Fernet = FakeFernet
+    module.DecryptionError = DecryptionError
+    monkeypatch.setitem(sys.modules, "rfernet", module)
+    lazy_secret._fernet_backend.cache_clear()
+    lazy_secret._fernet_for.cache_clear()
+    yield module
+    lazy_secret._fernet_backend.cache_clear()
+    lazy_secret._fernet_for.cache_clear()
+
+
+def test_rfernet_backend_is_used_when_installed(fake_rfernet):
+    from cryptography.fernet import Fernet
+
+    key = Fernet.generate_key()
+    token = Fernet(key).encrypt(b"hello").decode()
+
+    # bytes keys are passed to rfernet as str
+    secret = LazySecret(f"ENC({token})", key=key)
+    assert secret.get() == "hello"
+
+
+def test_rfernet_decryption_error_becomes_config_load_error(fake_rfernet):
+    from cryptography.fernet import Fernet
+
+    token = Fernet(Fernet.generate_key()).encrypt(b"hello").decode()
+    secret = LazySecret(f"ENC({token})", key=Fernet.generate_key().decode())
+
+    with pytest.raises(ConfigLoadError, match="Invalid Fernet key or ciphertext"):
+        secret.get()
+
+
+def test_rfernet_other_errors_are_not_reported_as_bad_tokens(fake_rfernet, monkeypatch):
+    from cryptography.fernet import Fernet
+
+    def broken_decrypt(self, token):
+        raise TypeError("unexpected argument type")
+
+    monkeypatch.setattr(fake_rfernet.Fernet, "decrypt", broken_decrypt)
+    secret = LazySecret("ENC(token)", key=Fernet.generate_key().decode())
+
+    with pytest.raises(TypeError):
+        secret.get()
+
+
+def test_rfernet_without_decryption_error_falls_back_to_cryptography(
+    fake_rfernet, monkeypatch
+):
+    from cryptography.fernet import Fernet
+    from sprigconfig import lazy_secret
+
+    monkeypatch.delattr(fake_rfernet, "DecryptionError")
+
+    assert lazy_secret._fernet_backend()[0] is Fernet
+
+
 # ----------------------------------------------------------------------
 # APP_CONFIG_DIR DEFAULT
 # ----------------------------------------------------------------------
@@ -213,3 +407,168 @@ def test_integration_singleton_dotted_keys(config_dir):
     ConfigSingleton.initialize(profile="dev", config_dir=config_dir)
     cfg = ConfigSingleton.get()
     assert cfg.get("logging.level") == "INFO"
+
+
+# ----------------------------------------------------------------------
+# PARSED-FILE CACHE
+# ----------------------------------------------------------------------
+
+def test_file_cache_returns_copies_and_sees_edits(tmp_path):
+    app = tmp_path / "application.yml"
+    app.write_text("server:\n  port: 8080\n", encoding="utf-8")
+
+    cfg1 = ConfigLoader(tmp_path, profile="dev").load()
+    cfg2 = ConfigLoader(tmp_path, profile="dev").load()
+    assert cfg1.get("server.port") == cfg2.get("server.port") == 8080
+    # Profile injection into one load must not leak into the cached tree
+    assert cfg1.to_dict() == cfg2.to_dict()
+
+    app.write_text("server:\n  port: 9090\n  host: x\n", encoding="utf-8")
+    cfg3 = ConfigLoader(tmp_path, profile="dev").load()
+    assert cfg3.get("server.port") == 9090
+
+
+def test_file_cache_survives_touch_and_tracks_env(tmp_path, monkeypatch):
+    app = tmp_path / "application.yml"
+    app.write_text("name: ${CACHE_TEST_NAME:anon}\nport: 1\n", encoding="utf-8")
+
+    monkeypatch.setenv("CACHE_TEST_NAME", "first")
+    assert ConfigLoader(tmp_path, profile="dev").load().get("name") == "first"
+
+    # Same content, new mtime: the digest still matches
+    os.utime(app, ns=(0, 0))
+    assert ConfigLoader(tmp_path, profile="dev").load().get("name") == "first"
+
+    # Same file, different environment: the expanded text differs
+    monkeypatch.setenv("CACHE_TEST_NAME", "second")
+    assert ConfigLoader(tmp_path, profile="dev").load().get("name") == "second"
+
+
+def test_file_cache_stamp_refresh_does_not_restore_cleared_entry(tmp_path, monkeypatch):
+    from sprigconfig import config_loader
+
+    app = tmp_path / "application.yml"
+    app.write_text("a: 1\n", encoding="utf-8")
+    resolved = str(app.resolve())
+    ConfigLoader(tmp_path, profile="dev").load()
+    assert resolved in config_loader._FILE_CACHE
+
+    # Clear the cache between the digest check's read and its write-back
+    parse_payload = ConfigLoader._parse_payload
+
+    def clearing_parse_payload(self, *args):
+        config_loader.clear_file_cache()
+        return parse_payload(self, *args)
+
+    monkeypatch.setattr(ConfigLoader, "_parse_payload", clearing_parse_payload)
+    os.utime(app, ns=(0, 0))
+    assert ConfigLoader(tmp_path, profile="dev").load().get("a") == 1
+    assert resolved not in config_loader._FILE_CACHE
+
+
+def test_file_cache_can_be_disabled_and_is_bounded(tmp_path, monkeypatch):
+    from sprigconfig import config_loader
+
+    app = tmp_path / "application.yml"
+    app.write_text("a: 1\n", encoding="utf-8")
+    resolved = str(app.resolve())
+    config_loader._FILE_CACHE.pop(resolved, None)
+
+    monkeypatch.setenv("SPRIGCONFIG_DISABLE_CACHE", "1")
+    assert ConfigLoader(tmp_path, profile="dev").load().get("a") == 1
+    assert resolved not in config_loader._FILE_CACHE
+
+    monkeypatch.delenv("SPRIGCONFIG_DISABLE_CACHE")
+    monkeypatch.setattr(config_loader, "FILE_CACHE_MAX_ENTRIES", 1)
+    ConfigLoader(tmp_path, profile="dev").load()
+    assert list(config_loader._FILE_CACHE) == [resolved]
+
+
+def test_singleton_clear_all_empties_file_cache(tmp_path):
+    from sprigconfig import config_loader
+
+    (tmp_path / "application.yml").write_text("a: 1\n", encoding="utf-8")
+    ConfigLoader(tmp_path, profile="dev").load()
+    assert config_loader._FILE_CACHE
+
+    ConfigSingleton._clear_all()
+    assert not config_loader._FILE_CACHE
+
+
+def test_reused_loader_re_resolves_imports_on_each_load(tmp_path):
+    (tmp_path / "application.yml").write_text("imports:\n  - common\n", encoding="utf-8")
+    (tmp_path / "common.yml").write_text("x: 1\n", encoding="utf-8")
+    loader = ConfigLoader(tmp_path, profile="dev")
+    first = loader.load()
+    sources = list(first.get("sprigconfig._meta.sources"))
+
+    # Same import key, different extension on disk
+    (tmp_path / "common.yml").rename(tmp_path / "common.yaml")
+    second = loader.load()
+
+    assert second.get("x") == 1
+    assert [Path(p).name for p in second.get("sprigconfig._meta.sources")] == [
+        "application.yml", "common.yaml"
+    ]
+    # The first Config's traces are not appended to by the second load
+    assert list(first.get("sprigconfig._meta.sources")) == sources
+
+
+def test_import_vanishing_after_resolution_raises(tmp_path, monkeypatch):
+    (tmp_path / "application.yml").write_text("imports:\n  - common\n", encoding="utf-8")
+    (tmp_path / "common.yml").write_text("x: 1\n", encoding="utf-8")
+    loader = ConfigLoader(tmp_path, profile="dev")
+
+    # Resolve as usual, then delete the file before it is read
+    resolve = loader._resolve_import
+
+    def resolve_then_delete(import_key):
+        resolved = resolve(import_key)
+        os.remove(resolved)
+        return resolved
+
+    monkeypatch.setattr(loader, "_resolve_import", resolve_then_delete)
+
+    with pytest.raises(ConfigLoadError, match="Import 'common' not found"):
+        loader.load()
+
+
+def test_reused_loader_sees_files_created_between_loads(tmp_path):
+    (tmp_path / "application.yml").write_text("a: 1\n", encoding="utf-8")
+    loader = ConfigLoader(tmp_path, profile="dev")
+    assert loader.load().get("a") == 1
+
+    # Directory listings are per load(), not per loader
+    (tmp_path / "application-dev.yml").write_text("a: 2\n", encoding="utf-8")
+    assert loader.load().get("a") == 2
+
+
+def test_exists_falls_back_to_filesystem_for_unlisted_names(tmp_path, monkeypatch):
+    """Case-insensitive POSIX filesystems match names the listing spells differently."""
+    (tmp_path / "common.yml").write_text("a: 1\n", encoding="utf-8")
+    loader = ConfigLoader(tmp_path, profile="dev")
+
+    # Emulate macOS APFS: lookups ignore case, listings keep the stored name
+    real_exists = os.path.exists
+    monkeypatch.setattr(
+        os.path, "exists",
+        lambda p: real_exists(os.path.join(os.path.dirname(p), os.path.basename(p).lower())),
+    )
+
+    assert loader._exists(str(tmp_path / "Common.yml"))
+    assert not loader._exists(str(tmp_path / "missing.yml"))
+
+
+# ----------------------------------------------------------------------
+# UTF-8 BOM
+# ----------------------------------------------------------------------
+
+def test_utf8_bom_is_stripped(tmp_path):
+    (tmp_path / "application.yml").write_bytes(
+        b"\xef\xbb\xbfserver:\n  port: 8080\n"
+    )
+
+    cfg = ConfigLoader(tmp_path, profile="dev").load()
+
+    assert cfg.get("server.port") == 8080
+    assert "﻿server" not in cfg
@@ -6,6 +6,7 @@
 
 from sprigconfig import ConfigLoader, load_config
 from sprigconfig.exceptions import ConfigValidationError
+from sprigconfig.lazy_secret import LazySecret
 import sprigconfig.config_loader as config_loader_module
 
 
@@ -320,3 +321,16 @@ def test_dataclass_instance_is_rejected_as_schema(tmp_path):
             profile="dev",
             schema=MinimalSchema("accepted"),
         ).load()
+
+
+@dataclass
+class SecretSchema:
+    password: str
+
+
+def test_encrypted_values_are_validated_as_strings(tmp_path):
+    _write_yaml(tmp_path / "application.yml", "password: ENC(not-a-real-token)\n")
+
+    cfg = ConfigLoader(config_dir=tmp_path, profile="dev", schema=SecretSchema).load()
+
+    assert isinstance(cfg.get("password"), LazySecret)